@@ -616,47 +616,47 @@ def ingest_sharepoint(
         
         ragApi = RagApi(saia_base_url,saia_api_token, saia_profile)
 
-        # Default to ingest directly to index
-        loader = SharePointReader(
-            client_id=client_id,
-            client_secret=client_secret,
-            tenant_id=tenant_id,
-            sharepoint_site_name = sharepoint_site_name,
-            sharepoint_folder_path = sharepoint_folder_path
-        )
-        
         download_directory = download_dir if download_dir else tempfile.TemporaryDirectory().name        
     
         if saia_base_url is not None:
             # Use Saia API to ingest
             files_to_upload = []
-            if reprocess_failed_files:
-                logging.getLogger().info(f"Checking for files to sync with {saia_profile} profile.")
-                docs_to_reprocess = search_failed_files(download_directory, reprocess_valid_status_list)
+            # Default to ingest directly to index, the reader session is closed even if a download fails
+            with SharePointReader(
+                client_id=client_id,
+                client_secret=client_secret,
+                tenant_id=tenant_id,
+                sharepoint_site_name = sharepoint_site_name,
+                sharepoint_folder_path = sharepoint_folder_path,
+                max_parallel_executions = max_parallel_executions
+            ) as loader:
+                if reprocess_failed_files:
+                    logging.getLogger().info(f"Checking for files to sync with {saia_profile} profile.")
+                    docs_to_reprocess = search_failed_files(download_directory, reprocess_valid_status_list)
                 
-                if len(docs_to_reprocess) > 0:
-                    logging.getLogger().info(f"Deleting files with status: {reprocess_valid_status_list}.")
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel_executions) as executor:
-                        futures = [executor.submit(ragApi.delete_profile_document, saia_profile, d['id']) for d in docs_to_reprocess]
-                    concurrent.futures.wait(futures)
+                    if len(docs_to_reprocess) > 0:
+                        logging.getLogger().info(f"Deleting files with status: {reprocess_valid_status_list}.")
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel_executions) as executor:
+                            futures = [executor.submit(ragApi.delete_profile_document, saia_profile, d['id']) for d in docs_to_reprocess]
+                        concurrent.futures.wait(futures)
 
-                    logging.getLogger().info(f"Downloading files from sharepoint.")
+                        logging.getLogger().info(f"Downloading files from sharepoint.")
                     
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel_executions) as executor:
-                        futures = [executor.submit(loader.download_file_by_id, d['name'], find_value_by_key(d['metadata'], 'file_id'), os.path.dirname(d['file_path'][0:(len('.saia.metadata'))*-1])) for d in docs_to_reprocess]
-                    concurrent.futures.wait(futures)
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel_executions) as executor:
+                            futures = [executor.submit(loader.download_file_by_id, d['name'], find_value_by_key(d['metadata'], 'file_id'), os.path.dirname(d['file_path'][0:(len('.saia.metadata'))*-1])) for d in docs_to_reprocess]
+                        concurrent.futures.wait(futures)
                         
-                    files_to_upload = [d['file_path'][0:(len('.saia.metadata'))*-1] for d in docs_to_reprocess]
-
-            else:
-                files = loader.download_files_from_folder(
-                    sharepoint_site_name=sharepoint_site_name,
-                    sharepoint_folder_path=sharepoint_folder_path,
-                    recursive=recursive,
-                    download_dir = download_directory
-                )
+                        files_to_upload = [d['file_path'][0:(len('.saia.metadata'))*-1] for d in docs_to_reprocess]
+
+                else:
+                    files = loader.download_files_from_folder(
+                        sharepoint_site_name=sharepoint_site_name,
+                        sharepoint_folder_path=sharepoint_folder_path,
+                        recursive=recursive,
+                        download_dir = download_directory
+                    )
                 
-                files_to_upload = files.keys()
+                    files_to_upload = files.keys()
             
             if len(files_to_upload) > 0:
                 logging.getLogger().info(f"Uploading files to {saia_profile}")
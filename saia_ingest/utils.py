@@ -4,6 +4,15 @@ import magic
 import logging
 import yaml
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Shared by every caller of detect_file_extension, magic.Magic loads the magic database on creation
+_mime = None
+
 def get_yaml_config(yaml_file):
     # Load the configuration from the YAML file
     with open(yaml_file, 'r') as file:
@@ -11,7 +20,10 @@ def get_yaml_config(yaml_file):
     return config
 
 def detect_file_extension(file_path):
-    mime = magic.Magic()
+    global _mime
+    if _mime is None:
+        _mime = magic.Magic()
+    mime = _mime
 
     # Open the file in binary mode
     with open(file_path, 'rb') as file:
@@ -49,21 +61,24 @@ def get_metadata_file(file_path, file_name, metadata_extension =  '.json') -> di
 def load_json_file(file_path) -> dict:
     ret = None
     try:
-        with open(file_path, 'r', encoding='utf-8') as json_file:
-            ret = json.load(json_file)
-    except Exception as e:
+        with open(file_path, 'rb') as json_file:
+            ret = _json_loads(json_file.read())
+    except FileNotFoundError:
         pass
+    except json.JSONDecodeError as e:
+        logging.getLogger().warning(f"Error decoding JSON in file: {file_path} {e}")
     return ret
 
 def search_failed_files(directory, failed_status):
     file_list = []
+    failed_status = frozenset(failed_status)
     for root, _, files in os.walk(directory):
         for file in files:
             if file.endswith('.saia.metadata'):
                 file_path = os.path.join(root, file)
-                with open(file_path, 'r') as f:
+                with open(file_path, 'rb') as f:
                     try:
-                        data = json.load(f)
+                        data = _json_loads(f.read())
                         if data['indexStatus'] in failed_status:
                             data['file_path'] = file_path 
                             file_list.append(data)
@@ -5,8 +5,6 @@ from ast import literal_eval
 # Ignore unclosed SSL socket warnings - optional in case you get these errors
 import warnings
 
-import pinecone
-
 warnings.filterwarnings(action="ignore", message="unclosed", category=ResourceWarning)
 warnings.filterwarnings("ignore", category=DeprecationWarning) 
 
@@ -3,20 +3,55 @@
 
 import logging
 import os
+import time
+import hashlib
+import threading
+import shutil
 import tempfile
 import json
-from typing import Any, Dict, List, Union, Optional
-from typing import Any, Dict, List, Optional
+import concurrent.futures
+from collections import deque
+from typing import Any, Dict, List, Tuple, Union, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from llama_index.readers import SimpleDirectoryReader
 from llama_index.readers.base import BaseReader, BasePydanticReader
 from llama_index.schema import Document
 from llama_index.bridge.pydantic import PrivateAttr, Field
-from saia_ingest.utils import change_file_extension
+from saia_ingest.utils import change_file_extension, load_json_file
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode()
 
 logger = logging.getLogger(__name__)
 
+GRAPH_ENDPOINT = "https://graph.microsoft.com/v1.0"
+GRAPH_BATCH_ENDPOINT = f"{GRAPH_ENDPOINT}/$batch"
+# Microsoft Graph accepts at most 20 requests per JSON batch
+GRAPH_BATCH_MAX_REQUESTS = 20
+# Throttling and transient server errors, retried by the session and inside batches
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+# (connect, read) timeouts in seconds and chunk size used when streaming file downloads
+DOWNLOAD_TIMEOUT = (10, 120)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Only the driveItem properties the reader uses are requested when listing folders
+FOLDER_ITEM_SELECT = "id,name,file,folder,parentReference,webUrl,eTag,lastModifiedDateTime,@microsoft.graph.downloadUrl"
+FOLDER_PAGE_SIZE = 999
+FILE_ITEM_SELECT = "id,name,parentReference,webUrl,eTag,lastModifiedDateTime"
+# Seconds before expiration when a cached access token is renewed
+TOKEN_EXPIRATION_MARGIN = 60
+
+# Access tokens shared by every reader in the process, keyed by a hash of the app credentials
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
 
 class SharePointReader(BasePydanticReader):
     """SharePoint reader.
@@ -34,6 +69,8 @@ class SharePointReader(BasePydanticReader):
         sharepoint_folder_id (Optional[str]): The ID of the SharePoint folder to download from. Overrides sharepoint_folder_path.
         file_extractor (Optional[Dict[str, BaseReader]]): A mapping of file extension to a BaseReader class that specifies how to convert that
                                                           file to text. See `SimpleDirectoryReader` for more details.
+        max_parallel_executions (Optional[int]): The maximum number of files downloaded in parallel, also the number of
+                                                 folder listing batches in flight. Default 5
     """
 
     client_id: str = None
@@ -45,11 +82,14 @@ class SharePointReader(BasePydanticReader):
     file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = Field(
         default=None, exclude=True
     )
+    max_parallel_executions: int = 5
 
-    _authorization_headers = PrivateAttr()
-    _site_id_with_host_name = PrivateAttr()
-    _drive_id_endpoint = PrivateAttr()
-    _drive_id = PrivateAttr()
+    _session = PrivateAttr()
+    _site_ids = PrivateAttr(default_factory=dict)
+    _drive_ids = PrivateAttr(default_factory=dict)
+    _site_id_with_host_name = PrivateAttr(default=None)
+    _drive_id_endpoint = PrivateAttr(default=None)
+    _drive_id = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -60,6 +100,7 @@ class SharePointReader(BasePydanticReader):
         sharepoint_folder_path: Optional[str] = None,
         sharepoint_folder_id: Optional[str] = None,
         file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = None,
+        max_parallel_executions: Optional[int] = 5,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -70,15 +111,42 @@ class SharePointReader(BasePydanticReader):
         self.sharepoint_site_name=sharepoint_site_name
         self.sharepoint_folder_path=sharepoint_folder_path
         self.file_extractor=file_extractor
+        self.max_parallel_executions=max_parallel_executions
         self.sharepoint_folder_ids = {}
 
+        # One session for every call so TCP and TLS connections are reused
+        self._session = requests.Session()
+        # Graph throttles with 429 and Retry-After, POST is retried too since $batch only carries GET requests.
+        # This only sees the status of the batch POST itself, throttled requests inside a batch are retried in _get_folders_children.
+        retries = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=64, max_retries=retries)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
     @classmethod
     def class_name(cls) -> str:
         return "SharePointReader"
 
+    def close(self) -> None:
+        """Closes the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> "SharePointReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def _get_access_token(self) -> str:
         """
         Gets the access_token for accessing file from SharePoint.
+        The token is cached per application credentials and only requested again when it is about to expire.
 
         Returns:
             str: The access_token for accessing the file.
@@ -86,34 +154,86 @@ class SharePointReader(BasePydanticReader):
         Raises:
             ValueError: If there is an error in obtaining the access_token.
         """
-        authority = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/token"
+        # The secret is part of the key, never keep it in plain text.
+        cache_key = hashlib.sha256(f"{self.tenant_id}|{self.client_id}|{self.client_secret}".encode()).hexdigest()
+
+        # Hold the lock while requesting so concurrent callers wait for a single token request.
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(cache_key)
+            if cached and cached[1] - time.monotonic() > TOKEN_EXPIRATION_MARGIN:
+                access_token = cached[0]
+            else:
+                access_token, expires_in = self._request_access_token()
+                _TOKEN_CACHE[cache_key] = (access_token, time.monotonic() + expires_in)
+
+        self._session.headers["Authorization"] = f"Bearer {access_token}"
+        return access_token
+
+    def _request_access_token(self) -> Tuple[str, int]:
+        """
+        Requests a new access_token with the client credentials grant.
+
+        Returns:
+            Tuple[str, int]: The access_token and its lifetime in seconds.
+
+        Raises:
+            ValueError: If there is an error in obtaining the access_token.
+        """
+        authority = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
 
         payload = {
             "grant_type": "client_credentials",
             "client_id": self.client_id,
             "client_secret": self.client_secret,
-            "resource": "https://graph.microsoft.com/",
+            "scope": "https://graph.microsoft.com/.default",
         }
 
-        response = requests.post(
+        response = self._session.post(
             url=authority,
             data=payload,
+            headers={"Authorization": None},
         )
+        data = _json_loads(response.content)
 
-        if response.status_code == 200 and "access_token" in response.json():
-            return response.json()["access_token"]
+        if response.status_code == 200 and "access_token" in data:
+            return data["access_token"], int(data.get("expires_in", 3600))
 
         else:
-            logger.error(response.json()["error"])
-            raise ValueError(response.json()["error_description"])
+            logger.error(data["error"])
+            raise ValueError(data["error_description"])
 
     def _get_folder_info_endpoint(self, folder_id) -> str:
         folder = f"items/{folder_id}" if (folder_id != '') else 'root'
-        return f"{self._drive_id_endpoint}/{self._drive_id}/{folder}/children"
+        return f"{self._drive_id_endpoint}/{self._drive_id}/{folder}/children?$select={FOLDER_ITEM_SELECT}&$top={FOLDER_PAGE_SIZE}"
 
-    def _get_site_id_with_host_name(self, access_token: str, sharepoint_site_name:str) -> str:
+    def _get_all_items(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Retrieves the site ID of a SharePoint site using the provided site name.
+        Follows the @odata.nextLink of a listing until every page is read.
+
+        Args:
+            data (Dict[str, Any]): The first page of the listing.
+
+        Returns:
+            List[Dict[str, Any]]: The items of all the pages.
+
+        Raises:
+            ValueError: If a page cannot be retrieved.
+        """
+        items = data["value"]
+        next_link = data.get("@odata.nextLink")
+        while next_link:
+            response = self._session.get(url=next_link)
+            data = _json_loads(response.content)
+            if response.status_code != 200:
+                logger.error(data["error"])
+                raise ValueError(data["error"])
+            items.extend(data["value"])
+            next_link = data.get("@odata.nextLink")
+        return items
+
+    def _get_site_id_with_host_name(self, sharepoint_site_name:str) -> str:
+        """
+        Retrieves the site ID of a SharePoint site using the provided site name, the ID is cached per site name.
 
         Args:
             sharepoint_site_name (str): The name of the SharePoint site.
@@ -124,35 +244,26 @@ class SharePointReader(BasePydanticReader):
         Raises:
             Exception: If the specified SharePoint site is not found.
         """
+        if sharepoint_site_name in self._site_ids:
+            return self._site_ids[sharepoint_site_name]
+
         site_information_endpoint = (
-            f"https://graph.microsoft.com/v1.0/sites?search={sharepoint_site_name}"
+            f"{GRAPH_ENDPOINT}/sites?search={sharepoint_site_name}"
         )
-        self._authorization_headers = {"Authorization": f"Bearer {access_token}"}
+        response = self._session.get(url=site_information_endpoint, params={"$select": "id"})
 
-        response = requests.get(
-            url=site_information_endpoint,
-            headers=self._authorization_headers,
+        site_id = self._extract_first_id(
+            response, f"The specified sharepoint site {sharepoint_site_name} is not found."
         )
-        
-        if response.status_code == 200 and "value" in response.json():
-            if (
-                len(response.json()["value"]) > 0
-                and "id" in response.json()["value"][0]
-            ):
-                return response.json()["value"][0]["id"]
-            else:
-                raise ValueError(
-                    f"The specified sharepoint site {sharepoint_site_name} is not found."
-                )
-        else:
-            if "error_description" in response.json():
-                logger.error(response.json()["error"])
-                raise ValueError(response.json()["error_description"])
-            raise ValueError(response.json()["error"])
+        self._site_ids[sharepoint_site_name] = site_id
+        return site_id
 
-    def _get_drive_id(self) -> str:
+    def _get_drive_id(self, sharepoint_site_name: Optional[str] = None) -> str:
         """
-        Retrieves the drive ID of the SharePoint site.
+        Retrieves the drive ID of the SharePoint site, the ID is cached per site.
+
+        Args:
+            sharepoint_site_name (Optional[str]): The name of the SharePoint site, defaults to the reader site.
 
         Returns:
             str: The ID of the SharePoint site drive.
@@ -161,30 +272,55 @@ class SharePointReader(BasePydanticReader):
             ValueError: If there is an error in obtaining the drive ID.
         """
         
+        self._get_access_token()
         self._site_id_with_host_name = self._get_site_id_with_host_name(
-            self._get_access_token(), self.sharepoint_site_name
+            sharepoint_site_name or self.sharepoint_site_name
         )
         
-        self._drive_id_endpoint = f"https://graph.microsoft.com/v1.0/sites/{self._site_id_with_host_name}/drives"
+        self._drive_id_endpoint = f"{GRAPH_ENDPOINT}/sites/{self._site_id_with_host_name}/drives"
+
+        if self._site_id_with_host_name in self._drive_ids:
+            return self._drive_ids[self._site_id_with_host_name]
 
-        response = requests.get(
-            url=self._drive_id_endpoint,
-            headers=self._authorization_headers,
+        response = self._session.get(url=self._drive_id_endpoint, params={"$select": "id"})
+
+        drive_id = self._extract_first_id(
+            response, "Error occurred while fetching the drives for the sharepoint site."
         )
+        self._drive_ids[self._site_id_with_host_name] = drive_id
+        return drive_id
 
-        if response.status_code == 200 and "value" in response.json():
-            if (
-                len(response.json()["value"]) > 0
-                and "id" in response.json()["value"][0]
-            ):
-                return response.json()["value"][0]["id"]
-            else:
-                raise ValueError(
-                    "Error occurred while fetching the drives for the sharepoint site."
-                )
-        else:
-            logger.error(response.json()["error"])
-            raise ValueError(response.json()["error_description"])
+    def _ensure_drive(self) -> None:
+        """
+        Resolves the drive of the reader site when no drive was resolved yet.
+        """
+        if self._drive_id is None:
+            self._drive_id = self._get_drive_id()
+
+    def _extract_first_id(self, response: requests.Response, not_found_message: str) -> str:
+        """
+        Gets the ID of the first element of a Graph collection response.
+
+        Args:
+            response (requests.Response): The Graph response with a "value" collection.
+            not_found_message (str): The error message used when the collection is empty.
+
+        Returns:
+            str: The ID of the first element.
+
+        Raises:
+            ValueError: If the request failed or the collection is empty.
+        """
+        data = _json_loads(response.content)
+
+        if response.status_code != 200:
+            logger.error(data["error"])
+            raise ValueError(data.get("error_description", data["error"]))
+
+        values = data.get("value", [])
+        if len(values) == 0 or "id" not in values[0]:
+            raise ValueError(not_found_message)
+        return values[0]["id"]
 
     def _get_sharepoint_folder_id(self, folder_path: str) -> str:
         """
@@ -197,19 +333,18 @@ class SharePointReader(BasePydanticReader):
             str: The ID of the SharePoint site folder.
         """
         if not folder_path == '':
+            self._ensure_drive()
             folder_id_endpoint = (
-                f"{self._drive_id_endpoint}/{self._get_drive_id()}/root:/{folder_path}"
+                f"{self._drive_id_endpoint}/{self._drive_id}/root:/{folder_path}"
             )
 
-            response = requests.get(
-                url=folder_id_endpoint,
-                headers=self._authorization_headers,
-            )
+            response = self._session.get(url=folder_id_endpoint)
+            data = _json_loads(response.content)
 
-            if response.status_code == 200 and "id" in response.json():
-                return response.json()["id"]
+            if response.status_code == 200 and "id" in data:
+                return data["id"]
             else:
-                raise ValueError(response.json()["error"])
+                raise ValueError(data["error"])
         return ''
     
     def _download_files_and_extract_metadata_from_endpoint(
@@ -233,33 +368,119 @@ class SharePointReader(BasePydanticReader):
             ValueError: If there is an error in downloading the files.
         """
 
-        response = requests.get(
-            url=folder_info_endpoint,
-            headers=self._authorization_headers,
-        )
+        response = self._session.get(url=folder_info_endpoint)
+        data = _json_loads(response.content)
 
         if response.status_code == 200:
-            data = response.json()
-            metadata = {}
-            for item in data["value"]:
-                if include_subfolders and "folder" in item:
-                    sub_folder_download_dir = os.path.join(download_dir, item["name"])
-                    subfolder_metadata = self._download_files_and_extract_metadata_from_endpoint(
-                        folder_info_endpoint=self._get_folder_info_endpoint(item["id"]),
-                        download_dir=sub_folder_download_dir,
-                        include_subfolders=include_subfolders,
-                    )
-
-                    metadata.update(subfolder_metadata)
-
-                elif "file" in item:
-                    file_metadata = self._download_file(item, download_dir)
-                    metadata.update(file_metadata)
+            # Downloads and folder listings run in separate pools so listings are never queued behind downloads.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_parallel_executions) as executor, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=self.max_parallel_executions) as listing_executor:
+                futures = []
+                # Breadth-first walk over a work queue, pending folders are listed together in batch requests.
+                pending_folders = deque()
+                listings = set()
+                listed = [(self._get_all_items(data), download_dir)]
+                while True:
+                    for items, folder_download_dir in listed:
+                        file_items = []
+                        for item in items:
+                            if include_subfolders and "folder" in item:
+                                # Empty folders have nothing to download, skip listing them.
+                                if item["folder"].get("childCount", 1) == 0:
+                                    continue
+                                sub_folder_download_dir = os.path.join(folder_download_dir, item["name"])
+                                pending_folders.append((self._get_folder_info_endpoint(item["id"]), sub_folder_download_dir))
+                            elif "file" in item:
+                                file_items.append(item)
+                        if len(file_items) > 0:
+                            # Create the directory once so parallel downloads do not race on it.
+                            os.makedirs(folder_download_dir, exist_ok=True)
+                            futures.extend(
+                                executor.submit(self._download_file, item, folder_download_dir) for item in file_items
+                            )
+                    # Keep up to max_parallel_executions batches in flight, each one is handled as soon as it completes.
+                    while len(pending_folders) > 0 and len(listings) < self.max_parallel_executions:
+                        batch = [pending_folders.popleft() for _ in range(min(len(pending_folders), GRAPH_BATCH_MAX_REQUESTS))]
+                        listings.add(listing_executor.submit(self._get_folders_children, batch))
+                    if len(listings) == 0:
+                        break
+                    done, listings = concurrent.futures.wait(listings, return_when=concurrent.futures.FIRST_COMPLETED)
+                    listed = [folder for listing in done for folder in listing.result()]
+
+                # Each download yields a (file_path, metadata) pair, the result is built once.
+                metadata = dict(future.result() for future in futures)
             logger.info(f"Download finished.")
             return metadata
         else:
-            logger.error(response.json()["error"])
-            raise ValueError(response.json()["error"])
+            logger.error(data["error"])
+            raise ValueError(data["error"])
+
+    def _post_graph_batch(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Sends a single Microsoft Graph JSON batch.
+
+        Args:
+            urls (List[str]): Graph URLs to request, at most GRAPH_BATCH_MAX_REQUESTS.
+
+        Returns:
+            List[Dict[str, Any]]: The batch responses, in the same order as urls.
+
+        Raises:
+            ValueError: If the batch request fails.
+        """
+        payload = {
+            "requests": [
+                {"id": str(i), "method": "GET", "url": url[len(GRAPH_ENDPOINT):] if url.startswith(GRAPH_ENDPOINT) else url}
+                for i, url in enumerate(urls)
+            ]
+        }
+
+        # Long folder walks can outlive the token, a cached token that is still valid costs no request.
+        self._get_access_token()
+        response = self._session.post(url=GRAPH_BATCH_ENDPOINT, json=payload)
+        data = _json_loads(response.content)
+
+        if response.status_code != 200:
+            logger.error(data["error"])
+            raise ValueError(data["error"])
+
+        # Batch responses are not guaranteed to come back in request order.
+        by_id = {r["id"]: r for r in data["responses"]}
+        return [by_id[str(i)] for i in range(len(urls))]
+
+    def _get_folders_children(self, folders: List[tuple]) -> List[tuple]:
+        """
+        Lists the children of several folders with a single batch request.
+
+        Args:
+            folders (List[tuple]): (folder_info_endpoint, download_dir) pairs, at most GRAPH_BATCH_MAX_REQUESTS.
+
+        Returns:
+            List[tuple]: (children, download_dir) pairs for each folder.
+
+        Raises:
+            ValueError: If a folder cannot be listed.
+        """
+        responses = self._post_graph_batch([endpoint for endpoint, _ in folders])
+
+        ret = []
+        for (folder_info_endpoint, folder_download_dir), response in zip(folders, responses):
+            status = response["status"]
+            body = response.get("body", {})
+            if status in RETRY_STATUS_CODES:
+                # Graph throttles the requests inside a batch one by one, the batch itself still succeeds.
+                # Wait as told and list the folder on its own so the session Retry policy applies.
+                retry_after = str(response.get("headers", {}).get("Retry-After", ""))
+                if retry_after.isdigit():
+                    time.sleep(int(retry_after))
+                retried = self._session.get(url=folder_info_endpoint)
+                status = retried.status_code
+                body = _json_loads(retried.content)
+            if status != 200:
+                logger.error(body.get("error"))
+                raise ValueError(body.get("error"))
+            ret.append((self._get_all_items(body), folder_download_dir))
+        return ret
 
     def _download_file_by_url(self, item: Dict[str, Any], download_dir: str) -> str:
         """
@@ -276,17 +497,37 @@ class SharePointReader(BasePydanticReader):
         file_download_url = item["@microsoft.graph.downloadUrl"]
         file_name = item["name"]
 
-        response = requests.get(file_download_url)
-
-        # Create the directory if it does not exist and save the file.
-        if not os.path.exists(download_dir):
-            os.makedirs(download_dir)
         file_path = os.path.join(download_dir, file_name)
-        with open(file_path, "wb") as f:
-            f.write(response.content)
+
+        # The download URL is pre-authenticated and must not receive the Graph token.
+        self._download_content(file_download_url, file_path, {"Authorization": None})
 
         return file_path
 
+    def _download_content(self, url: str, file_path: str, headers: Dict[str, Any]) -> None:
+        """
+        Streams the content of the URL to the file, a 304 answer to a conditional request keeps the copy on disk.
+
+        Args:
+            url (str): The URL of the file content.
+            file_path (str): The path where the file is saved.
+            headers (Dict[str, Any]): Additional request headers.
+        """
+        # Stream the body to disk so large files are never held in memory.
+        with self._session.get(
+            url,
+            headers=headers,
+            stream=True,
+            timeout=DOWNLOAD_TIMEOUT,
+        ) as response:
+            if response.status_code == 304:
+                logger.debug(f"{file_path} not modified")
+                return
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+
     def _extract_metadata_for_file(self, item: Dict[str, Any], file_path: str) -> Dict[str, str]:
         """
         Extracts metadata related to the file.
@@ -310,10 +551,11 @@ class SharePointReader(BasePydanticReader):
             "lastModifiedDateTime": item.get("lastModifiedDateTime")
         }
         
-        medatada_path = change_file_extension(file_path, '.metadata')
+        metadata_path = change_file_extension(file_path, '.metadata')
         
-        with open(medatada_path , "w") as f:
-            f.write(json.dumps(metadata, indent=2))
+        # Compact output written straight to the file, the sidecar is read back by the uploader.
+        with open(metadata_path, "wb") as f:
+            f.write(_json_dumps(metadata))
             
         return metadata
 
@@ -321,13 +563,24 @@ class SharePointReader(BasePydanticReader):
         self,
         item: Dict[str, Any],
         download_dir: str,
-    ):
-        metadata = {}
+    ) -> Tuple[str, Dict[str, str]]:
+        file_path = os.path.join(download_dir, item["name"])
+
+        # A file already on disk with the same eTag is current, reuse it without any request.
+        # Reading the sidecar first checks for it without a separate stat, the file is only checked on a match.
+        previous_metadata = load_json_file(change_file_extension(file_path, '.metadata'))
+        if (
+            previous_metadata
+            and item.get("eTag")
+            and previous_metadata.get("eTag") == item["eTag"]
+            and os.path.exists(file_path)
+        ):
+            logger.debug(f"{file_path} is up to date")
+            return file_path, previous_metadata
 
         file_path = self._download_file_by_url(item, download_dir)
 
-        metadata[file_path] = self._extract_metadata_for_file(item, file_path)
-        return metadata
+        return file_path, self._extract_metadata_for_file(item, file_path)
 
     def download_files_from_folder(
         self,
@@ -352,18 +605,15 @@ class SharePointReader(BasePydanticReader):
         
         logger.info(f"Downloading files from '{sharepoint_folder_path}' to {download_dir}")
         
-        access_token = self._get_access_token()
-
-        self._site_id_with_host_name = self._get_site_id_with_host_name(
-            access_token, sharepoint_site_name
-        )
-
-        self._drive_id = self._get_drive_id()
+        self._drive_id = self._get_drive_id(sharepoint_site_name)
 
-        sharepoint_folder_id = self.sharepoint_folder_ids[sharepoint_folder_path] if (
-            sharepoint_folder_path in self.sharepoint_folder_ids.keys()) else self._get_sharepoint_folder_id(
+        # The same folder path can exist in the drive of another site, the key stays a string so the reader still serializes.
+        folder_key = f"{self._drive_id}:{sharepoint_folder_path}"
+        if folder_key not in self.sharepoint_folder_ids:
+            self.sharepoint_folder_ids[folder_key] = self._get_sharepoint_folder_id(
                 sharepoint_folder_path
             )
+        sharepoint_folder_id = self.sharepoint_folder_ids[folder_key]
 
         folder_info_endpoint = self._get_folder_info_endpoint(sharepoint_folder_id)
                 
@@ -395,21 +645,33 @@ class SharePointReader(BasePydanticReader):
         self._drive_id = self._get_drive_id()
         
         file_url = f"{self._drive_id_endpoint}/{self._drive_id}/items/{sharepoint_file_id}"
-        
-        response = requests.get(
-            url=file_url,
-            headers=self._authorization_headers,
-        )
+        file_path = os.path.join(download_dir, sharepoint_file_name)
+        os.makedirs(download_dir, exist_ok=True)
+
+        # The eTag is not known before the request, ask for the content only if it changed since the copy on disk.
+        headers = {}
+        previous_metadata = load_json_file(change_file_extension(file_path, '.metadata'))
+        if previous_metadata and previous_metadata.get("eTag") and os.path.exists(file_path):
+            headers["If-None-Match"] = previous_metadata["eTag"]
+
+        # The content redirects to the pre-authenticated download URL, requests drops the token on that hop.
+        # It does not depend on the item properties, so both requests run at the same time.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            item_future = executor.submit(self._session.get, url=f"{file_url}?$select={FILE_ITEM_SELECT}")
+            content_future = executor.submit(self._download_content, f"{file_url}/content", file_path, headers)
+
+        response = item_future.result()
+        data = _json_loads(response.content)
 
         if response.status_code == 200:
-            data = response.json()
-            metadata = self._download_file(data, download_dir)
+            content_future.result()
+            metadata = {file_path: self._extract_metadata_for_file(data, file_path)}
             
             logger.info(f"Download finished.")
             return metadata
             
-        logger.error(response.json()["error"])
-        raise ValueError(response.json()["error"])
+        logger.error(data["error"])
+        raise ValueError(data["error"])
 
     def _load_documents_with_metadata(
         self,
@@ -1,5 +1,9 @@
 import pytest
 import os
+from types import MappingProxyType
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 @pytest.fixture(scope="session")
 def configuration():
@@ -10,4 +14,45 @@ def configuration():
             "profile": os.environ.get('ASSISTANT_NAME')
         }
     }
-    return conf
\ No newline at end of file
+    return conf
+
+@pytest.fixture(scope="session")
+def config(configuration):
+    saia_level = configuration.get('saia', {})
+    saia_base_url = saia_level.get('base_url', None)
+    saia_api_token = saia_level.get('api_token', None)
+
+    if not saia_base_url:
+        raise ValueError("Missing $BASE_URL")
+
+    if not saia_api_token:
+        raise ValueError("Missing $SAIA_APITOKEN")
+
+    # Shared by every test of the session, read-only so one test cannot change it for the others
+    return MappingProxyType(saia_level)
+
+@pytest.fixture(scope="session")
+def http_session(config):
+    # Shared by every test so keep-alive connections are reused instead of a new TLS handshake per request
+    if os.environ.get('SAIA_PROXY_CACHE'):
+        # Opt-in replay of recorded responses for local re-runs, live runs stay the default
+        import requests_cache
+        session = requests_cache.CachedSession(
+            cache_name=os.path.join('.pytest_cache', 'saia_proxy'),
+            backend='sqlite',
+            allowable_methods=('GET', 'POST'),
+            expire_after=86400,
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Set once for every request, json= payloads already send the Content-Type
+    session.headers['Authorization'] = f"Bearer {config.get('api_token')}"
+    yield session
+    session.close()
@@ -9,22 +9,6 @@ import logging
 from saia_ingest.assistant_utils import get_assistants, get_assistant
 
 
-@pytest.fixture
-def config(configuration) -> dict:
-
-    saia_level = configuration.get('saia', {})
-    saia_base_url = saia_level.get('base_url', None)
-    saia_api_token = saia_level.get('api_token', None)
-
-    if not saia_base_url:
-        raise ValueError("Missing $BASE_URL")
-
-    if not saia_api_token:
-        raise ValueError("Missing $SAIA_APITOKEN")
-
-    return saia_level
-
-
 def test_assistants(config):
 
     base_url = config.get('base_url')
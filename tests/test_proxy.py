@@ -1,84 +1,65 @@
-import pytest
-import requests
-import json
-
-
-@pytest.fixture
-def config(configuration) -> dict:
-
-  saia_level = configuration.get('saia', {})
-  saia_base_url = saia_level.get('base_url', None)
-  saia_api_token = saia_level.get('api_token', None)
+'''
+Sample GeneXus Enterprise AI Proxy testing
+https://wiki.genexus.com/enterprise-ai/wiki?19,GeneXus+Enterprise+AI+Proxy
+'''
 
-  if not saia_base_url:
-      raise ValueError("Missing $BASE_URL")
-
-  if not saia_api_token:
-      raise ValueError("Missing $SAIA_APITOKEN")
-
-  return saia_level
+import pytest
 
 
-def test_proxy(config):
-  '''
-  Sample GeneXus Enterprise AI Proxy testing
-  https://wiki.genexus.com/enterprise-ai/wiki?19,GeneXus+Enterprise+AI+Proxy
-  '''
+@pytest.mark.parametrize("model,size", [("dall-e-2", "256x256")])
+def test_proxy_image_generation(config, http_session, model, size):
 
   base_url = config.get('base_url')
-  api_token = config.get('api_token')
 
   # generate an image with dall-e
   url = f"{base_url}/proxy/openai/v1/images/generations"
 
   payload = {
-    "model": "dall-e-2",
+    "model": model,
     "prompt": "a halloween pumpkin",
-    "size": "256x256"
-  }
-  headers = {
-    'Content-Type': 'application/json',
-    'Authorization': f"Bearer {api_token}",
+    "size": size
   }
 
-  result = requests.post(url, headers=headers, json=payload)
+  result = http_session.post(url, json=payload)
 
   assert result, "No result was returned"
 
-  response = json.loads(result.content)
+  response = result.json()
 
   assert response, "Invalid response"
 
-  image_url = response.get('data')[0].get('url')
+  image_url = response['data'][0]['url']
 
   assert image_url, "Invalid URL"
 
+  return
+
 
+@pytest.mark.parametrize("model", ["gpt-3.5-turbo"])
+def test_proxy_chat_completion(config, http_session, model):
+
+  base_url = config.get('base_url')
 
   # completions
   url = f"{base_url}/proxy/openai/v1/chat/completions"
 
   payload = {
-    "model": "gpt-3.5-turbo",
+    "model": model,
     "messages": [{
       "role": "user",
       "content": "Hi there"
     }]
   }
-  headers = {
-    'Content-Type': 'application/json',
-    'Authorization': f"Bearer {api_token}",
-  }
 
-  result = requests.post(url, headers=headers, json=payload)
+  result = http_session.post(url, json=payload)
 
   assert result, "No result was returned"
 
-  response = json.loads(result.content)
+  response = result.json()
 
   assert response, "Invalid response"
 
-  reply = response.get('choices')[0].get('message').get('content')
+  reply = response['choices'][0]['message']['content']
 
   assert reply, "Invalid reply"
 
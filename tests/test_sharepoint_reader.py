@@ -0,0 +1,179 @@
+import io
+import json
+import os
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+import requests
+
+from sharepoint import sharepoint_reader
+from sharepoint.sharepoint_reader import SharePointReader, GRAPH_ENDPOINT
+
+DOWNLOAD_HOST = "download.example.com"
+
+
+def _file(file_id, name, parent_id):
+    return {
+        "id": file_id,
+        "name": name,
+        "file": {},
+        "parentReference": {"id": parent_id},
+        "webUrl": f"https://contoso.sharepoint.com/{name}",
+        "eTag": f"etag-{file_id}",
+        "lastModifiedDateTime": "2024-01-01T00:00:00Z",
+        "@microsoft.graph.downloadUrl": f"https://{DOWNLOAD_HOST}/{file_id}",
+    }
+
+
+def _folder(folder_id, name, child_count):
+    return {"id": folder_id, "name": name, "folder": {"childCount": child_count}}
+
+
+# Children of each folder, split in listing pages
+TREE = {
+    "root": [
+        [_file("a", "a.txt", "root"), _folder("empty", "Empty", 0)],
+        [_folder("f1", "F1", 2)],
+    ],
+    "f1": [[_file("b", "b.txt", "f1"), _folder("f2", "F2", 1)]],
+    "f2": [[_file("c", "c.txt", "f2")]],
+}
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, content=b""):
+        self.status_code = status_code
+        self.content = json.dumps(body).encode() if body is not None else content
+        self.raw = io.BytesIO(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeGraphSession:
+    """Answers the Microsoft Graph calls of the reader from TREE."""
+
+    def __init__(self, batch_statuses=None):
+        self.headers = {}
+        # folder id -> statuses returned inside batches before the listing succeeds
+        self.batch_statuses = batch_statuses or {}
+        self.calls = []
+
+    def close(self):
+        pass
+
+    def _children(self, url):
+        parsed = urlparse(url)
+        parts = parsed.path.split("/")
+        folder_id = "root" if parts[-2] == "root" else parts[-2]
+        page = int(parse_qs(parsed.query).get("$skiptoken", ["0"])[0])
+        body = {"value": TREE[folder_id][page]}
+        if page + 1 < len(TREE[folder_id]):
+            body["@odata.nextLink"] = f"{url.split('&$skiptoken')[0]}&$skiptoken={page + 1}"
+        return body
+
+    def get(self, url, params=None, headers=None, stream=False, timeout=None):
+        self.calls.append(("GET", url, headers))
+        parsed = urlparse(url)
+        if parsed.netloc == DOWNLOAD_HOST:
+            return FakeResponse(200, content=f"content of {parsed.path[1:]}".encode())
+        if parsed.path.endswith("/sites"):
+            return FakeResponse(200, {"value": [{"id": "site"}]})
+        if parsed.path.endswith("/sites/site/drives"):
+            return FakeResponse(200, {"value": [{"id": "drive"}]})
+        if parsed.path.endswith("/children"):
+            return FakeResponse(200, self._children(url))
+        return FakeResponse(404, {"error": {"code": "itemNotFound", "message": url}})
+
+    def post(self, url, data=None, json=None, headers=None):
+        self.calls.append(("POST", url, headers))
+        if urlparse(url).netloc == "login.microsoftonline.com":
+            return FakeResponse(200, {"access_token": "token", "expires_in": 3600})
+
+        responses = []
+        for request in json["requests"]:
+            folder_id = request["url"].split("/")[-2]
+            statuses = self.batch_statuses.get(folder_id, [])
+            if statuses:
+                status = statuses.pop(0)
+                responses.append({
+                    "id": request["id"],
+                    "status": status,
+                    "headers": {"Retry-After": "0"},
+                    "body": {"error": {"code": str(status)}},
+                })
+            else:
+                responses.append({"id": request["id"], "status": 200, "body": self._children(GRAPH_ENDPOINT + request["url"])})
+        # Graph does not keep the request order in batch responses
+        return FakeResponse(200, {"responses": responses[::-1]})
+
+    def downloads(self):
+        return [call for call in self.calls if urlparse(call[1]).netloc == DOWNLOAD_HOST]
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    sharepoint_reader._TOKEN_CACHE.clear()
+
+
+def _reader(session):
+    reader = SharePointReader(client_id="client", client_secret="secret", tenant_id="tenant", sharepoint_site_name="site")
+    reader._session = session
+    return reader
+
+
+def test_download_walks_nested_folders(tmp_path):
+    session = FakeGraphSession()
+    metadata = _reader(session).download_files_from_folder("site", "", True, str(tmp_path))
+
+    expected = {"a.txt": "a", os.path.join("F1", "b.txt"): "b", os.path.join("F1", "F2", "c.txt"): "c"}
+    assert {os.path.relpath(path, tmp_path): value["file_id"] for path, value in metadata.items()} == expected
+    for path, file_id in expected.items():
+        assert (tmp_path / path).read_text() == f"content of {file_id}"
+
+    # F1 is only on the second page of the root listing
+    assert any("$skiptoken=1" in call[1] for call in session.calls)
+    # Empty folders are never listed
+    assert not any("items/empty" in call[1] for call in session.calls)
+    # Pre-authenticated download URLs never receive the Graph token
+    assert all(call[2] == {"Authorization": None} for call in session.downloads())
+
+
+def test_reader_serializes_after_download(tmp_path):
+    reader = _reader(FakeGraphSession())
+    reader.download_files_from_folder("site", "", True, str(tmp_path))
+
+    # Folder ids are cached per drive and path, "" being the drive root
+    assert list(json.loads(json.dumps(reader.dict()))["sharepoint_folder_ids"]) == ["drive:"]
+
+
+def test_unchanged_files_are_reused(tmp_path):
+    first = _reader(FakeGraphSession()).download_files_from_folder("site", "", True, str(tmp_path))
+
+    session = FakeGraphSession()
+    second = _reader(session).download_files_from_folder("site", "", True, str(tmp_path))
+
+    assert second == first
+    assert session.downloads() == []
+
+
+def test_throttled_batch_listing_is_retried(tmp_path):
+    session = FakeGraphSession(batch_statuses={"f1": [429]})
+    metadata = _reader(session).download_files_from_folder("site", "", True, str(tmp_path))
+
+    assert len(metadata) == 3
+    assert any(call[0] == "GET" and "items/f1/children" in call[1] for call in session.calls)
+
+
+def test_failing_batch_listing_raises(tmp_path):
+    session = FakeGraphSession(batch_statuses={"f1": [404]})
+
+    with pytest.raises(ValueError):
+        _reader(session).download_files_from_folder("site", "", True, str(tmp_path))